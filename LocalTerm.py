@@ -46,6 +46,48 @@
 # changed loading of files to use the file array
 # 20251106
 # Made column language2 invisble if only on language is selected
+# 20261015
+# rows are inserted with insert_with_valuesv instead of append
+# the lookups used while filling the model are bound to locals
+# sorting is switched off and the model detached while the files are loaded
+# the file list is cached and only rescanned when the directory changes
+# the files are parsed with the csv module, quoted commas are now handled
+# parsed files are cached until their modification time or size changes
+# main only rebuilds the model when the selected files or their contents have changed
+# terms only found in language 2 are merged with setdefault
+# the four language dictionaries are replaced by one entries dictionary
+# attribute lookups are hoisted out of the parse and load loops
+# the log level follows GRAMPS_LOG_LEVEL instead of always being info
+# the short file names are built once and the file array is set in on_load
+# the file list is read with os.scandir instead of glob, ignoring case
+# files are read in one go and split into lines before parsing
+# all lines of a file are parsed in one pass and split into good and bad rows
+# the color strings are interned
+# removed unused imports
+# dequote is a module function so the parser avoids the method call
+# parsing and filling the model are separated
+# files are opened directly and a missing file is handled by the exception
+# the files are read from the data directory and sorted by name
+# the translatable is cleaned with one precompiled regex
+# the model is built off screen and swapped into the treeview when it is full
+# the colors are set on the cell renderer, the model no longer holds them per row
+# removed commented out imports
+# the treeview columns are built from a table
+# translated texts are looked up once in module constants
+# malformed lines from both files are reported in one dialog
+# the URL of an anchor is composed by one cached helper
+# anchors are interned, the language files share them
+# a file where none of the first records has three sections is skipped with one message
+# the treeview uses fixed height mode with fixed width, resizable columns
+# the cleaned translatables are cached, the language files share them
+# closing the options without changes does not update the gramplet
+# the treeview columns are kept after they are built
+# the cleaned translatables are interned so both files share the keys
+# removed the unused line counter
+# the three sections of a record are unpacked by name instead of indexed
+# the term is dequoted and the anchor stripped again, as before the csv parser
+# removed the unused dequote and clean_translatable methods
+# a record running on into the next lines is reported, the next lines are kept
 # ----------------------------------------------------------------------------
 """
 Local term - a plugin for showing translatable terms
@@ -55,34 +97,27 @@ Local term - a plugin for showing translatable terms
 # from gramps.gen.plug import Gramplet
 
 import os
+import re
+import sys
+import csv
 import logging
-import glob
+import functools
+import itertools
 import gi
-import gramps.gen.utils.alive as est
 
-# from gramps.gen.utils.alive import update_constants
-from gramps.gen.utils.alive import probably_alive_range
 from gramps.gen.plug import Gramplet
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.version import VERSION as GRAMPSVERSION, VERSION_TUPLE
-from gramps.gen.datehandler import parser
-from gramps.gen.lib.date import Today
-
-# from gramps.gen.utils.db import get_birth_or_fallback, get_death_or_fallback
 from gramps.gen.config import config as configman
 from gramps.gui.display import display_url
 from gramps.gui.dialog import ErrorDialog
 from gramps.gen.plug.menu import (
     BooleanOption,
     StringOption,
-    BooleanListOption,
     ColorOption,
     NumberOption,
     EnumeratedListOption,
 )
 
-# from gi.repository import Pango
-
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk
 
@@ -94,8 +129,7 @@ from gi.repository import Gtk
 
 local_log = logging.getLogger("LocalTerm")
 _level = os.environ.get("GRAMPS_LOG_LEVEL", "WARNING")
-_level = "info"
-if _level == "info":
+if _level.lower() == "info":
     local_log.setLevel(logging.INFO)
 else:
     local_log.setLevel(logging.WARNING)
@@ -105,11 +139,40 @@ try:
 except ValueError:
     _trans = glocale.translation
 _ = _trans.gettext
+
+# translated texts, looked up once when the module is loaded
+_T_URL_BASE = _("The URL base the anchor will be attached to")
+_T_SHOW_ANCHOR = _("Show anchor column")
+_T_SEARCH_LANG = _("Search language")
+_T_FG = _("Foreground color")
+_T_BG = _("Background color")
+_T_LANG1 = _("Language 1")
+_T_LANG2 = _("Language 2")
+_T_TRANSLATABLE = _("Translatable")
+_T_ANCHOR = _("Anchor")
+_T_ERROR = _("Error:")
+_T_TIP = _("Double click row to follow link")
+_T_MAX_FILES = _("Max two files can be selecteda")
+_T_BAD_LINE = _(': line does not contain three sections separated by , in : "')
+_T_BAD_URL = _("Cannot open URL: ")
+_T_NOT_LOCALTERM = _(" is not a localterm file, the first lines do not contain three sections")
 lang = glocale.lang
 show_error = True
 local_log.info("---> before any fuction is called")
 # local_log.info("Maximum age = %s",_MAX_AGE_PROB_ALIVE);
-_config_file = os.path.join(os.path.dirname(__file__), "LocalTerm")
+_ADDON_DIR = os.path.dirname(__file__)
+_DATA_DIR = os.path.join(_ADDON_DIR, "data")
+_FILE_CACHE = None
+# initial width of the treeview columns, the user can resize them
+_COLUMN_WIDTH = 200
+# number of non-empty records checked before a file is parsed
+_PROBE_LINES = 5
+# '_("text")' with optional outer and inner quotes, group text is the term
+_TRANSLATABLE_RE = re.compile(
+    r"""\A\s*(?P<q>['"]?)_\(\s*(?P<iq>['"]?)(?P<text>.*?)(?P=iq)\s*\)(?P=q)\s*\Z""",
+    re.DOTALL,
+)
+_config_file = os.path.join(_ADDON_DIR, "LocalTerm")
 
 config = configman.register_manager(_config_file)
 config.register("myopt.show_anchor", False)
@@ -124,6 +187,83 @@ config.register("myopt.lang1",0)
 config.register("myopt.lang2",0)
 
 
+class _LocalTermDialect(csv.excel):
+    """
+    csv dialect of the localterm files, a space may follow each comma
+    """
+
+    skipinitialspace = True
+
+
+def _get_localterm_files():
+    """
+    return the sorted localterm files in the data directory, the directory is
+    only scanned again when its modification time changes
+    """
+    global _FILE_CACHE
+    try:
+        mtime = os.stat(_DATA_DIR).st_mtime_ns
+    except OSError:
+        return []
+    if _FILE_CACHE is None or _FILE_CACHE[0] != mtime:
+        with os.scandir(_DATA_DIR) as entries:
+            files = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith("localterm.csv")
+                and entry.is_file(follow_symlinks=False)
+            )
+        _FILE_CACHE = (mtime, files)
+    return list(_FILE_CACHE[1])
+
+
+def _file_stamp(flnm):
+    """
+    return (modification time, size) of a file or None if it can not be read
+    """
+    try:
+        stat = os.stat(flnm)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _dequote(s):
+    """
+    strip s and remove a matching pair of single or double quotes around it
+    """
+    s = s.strip()
+    if len(s) >= 2 and s[0] == s[-1] and s[0] in "'\"":
+        return s[1:-1]
+    return s
+
+
+@functools.lru_cache(maxsize=16384)
+def _clean_translatable(s):
+    """
+    the translatable without quotes and _(), a translatable without _()
+    only has its quotes removed
+    the result is cached and interned, the language files share the same
+    translatables, so both files use one key object per term
+    """
+    match = _TRANSLATABLE_RE.match(s)
+    if match is not None:
+        return sys.intern(match.group("text"))
+    return sys.intern(_dequote(_dequote(s)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _compose_url(anchor, url_bas):
+    """
+    the URL of an anchor, an anchor starting with https:// is used as it is
+    otherwise it is combined with the base URL from the setup
+    """
+    anchor = anchor.strip()
+    if anchor.startswith("https://"):
+        return anchor
+    return url_bas + "#" + anchor
+
+
 
 class LocalTerm(Gramplet):
     """
@@ -132,6 +272,9 @@ class LocalTerm(Gramplet):
 
     # pylint: disable=too-many-instance-attributes
 
+    # all model columns, passed to insert_with_valuesv for every row
+    _COLS = [0, 1, 2, 3]
+
     def init(self):
         local_log.info("--> dette var init")
         config.load()
@@ -140,13 +283,13 @@ class LocalTerm(Gramplet):
         self.gui.get_container_widget().add(self.gui.WIDGET)
         self.gui.WIDGET.show()
         self.model.clear()
-        flnam = os.path.join(os.path.dirname(__file__), "*localterm.csv")
-        self.__files = [f for f in glob.glob(flnam)]
+        self.__files = _get_localterm_files()
+        self.__file_names = None
 
-        self.lang1_txt = {}
-        self.lang2_txt = {}
-        self.lang1_loc = {}
-        self.lang2_loc = {}
+        self.entries = {}
+        self.__parse_cache = {}
+        self.__last_stamps = None
+        self.__errors = []
 
     def build_options(self):
         """
@@ -155,50 +298,54 @@ class LocalTerm(Gramplet):
         local_log.info("--> build_options")
         self.opts = []
 
-        name = _("The URL base the anchor will be attached to")
+        name = _T_URL_BASE
         opt = StringOption(name, self.__url_bas)
         self.opts.append(opt)
-        name = _("Show anchor column")
+        name = _T_SHOW_ANCHOR
         opt = BooleanOption(name, self.__show_anchor)
         self.opts.append(opt)
-        name = _("Search language")
+        name = _T_SEARCH_LANG
         opt = NumberOption(name, self.__search_lang, 1, 2, 1)
         self.opts.append(opt)
-        name = _("Foreground color")
+        name = _T_FG
         opt = ColorOption(name, self.__fg_sel)
         self.opts.append(opt)
-        name = _("Background color")
+        name = _T_BG
         opt = ColorOption(name, self.__bg_sel)
         self.opts.append(opt)
         local_log.info("files = %s", self.__files)
-        opt = EnumeratedListOption(_("Language 1"),self.__lang1)
-        i = 0
-        for filnm in self.__files:
-            short_fil_name = os.path.basename(filnm)
+        short_names = list(enumerate(self.file_names()))
+        opt = EnumeratedListOption(_T_LANG1,self.__lang1)
+        for i, short_fil_name in short_names:
             opt.add_item(i,short_fil_name)
-            i += 1
         self.opts.append(opt)
-        opt = EnumeratedListOption(_("Language 2"),self.__lang2)
-        i = 0
-        for filnm in self.__files:
-            short_fil_name = os.path.basename(filnm)
+        opt = EnumeratedListOption(_T_LANG2,self.__lang2)
+        for i, short_fil_name in short_names:
             opt.add_item(i,short_fil_name)
-            i += 1
         self.opts.append(opt)
         self.set_fl_ar()
         local_log.info("chosen files =%s  %s",self.__files[self.__lang1],self.__files[self.__lang2 ])
         list(map(self.add_option, self.opts))
     
+    def file_names(self):
+        """
+        the short names of the language files, built the first time they are needed
+        """
+        if self.__file_names is None:
+            self.__file_names = [os.path.basename(f) for f in self.__files]
+        return self.__file_names
+
     def set_fl_ar(self):
         """
         set the file array based on the selected languages
         """
+        file_names = self.file_names()
         self.__fl_ar = []
-        self.__fl_ar.append(os.path.basename(self.__files[self.__lang1]))
-        self.__url_ap = (os.path.basename(self.__files[self.__lang1]) ).split("_")[0]
+        self.__fl_ar.append(file_names[self.__lang1])
+        self.__url_ap = file_names[self.__lang1].split("_")[0]
         local_log.info("base for url = %s", self.__url_ap)
         if self.__lang2 != self.__lang1:
-            self.__fl_ar.append(os.path.basename(self.__files[self.__lang2]))
+            self.__fl_ar.append(file_names[self.__lang2])
 
     def save_options(self):
         """
@@ -209,8 +356,8 @@ class LocalTerm(Gramplet):
         self.__url_bas = self.opts[0].get_value()
         self.__show_anchor = self.opts[1].get_value()
         self.__search_lang = self.opts[2].get_value()
-        self.__fg_sel = self.opts[3].get_value()
-        self.__bg_sel = self.opts[4].get_value()
+        self.__fg_sel = sys.intern(self.opts[3].get_value())
+        self.__bg_sel = sys.intern(self.opts[4].get_value())
         self.__lang1 = self.opts[5].get_value()
         self.__lang2 = self.opts[6].get_value()
         self.set_fl_ar()
@@ -227,8 +374,8 @@ class LocalTerm(Gramplet):
 
         local_log.info("lang1  nu = %s", self.__lang1)        
         if len(self.__fl_ar) > 2:
-            errormessage = _("Max two files can be selecteda")
-            ErrorDialog(_("Error:"), errormessage)
+            errormessage = _T_MAX_FILES
+            ErrorDialog(_T_ERROR, errormessage)
         else:
             config.save()
 
@@ -237,8 +384,26 @@ class LocalTerm(Gramplet):
         Save a gramplet's options to file.
         """
         local_log.info("--> save_update_options")
+        before = self.option_values()
         self.save_options()
-        self.update()
+        if self.option_values() != before:
+            self.update()
+        else:
+            local_log.info("options unchanged, no update")
+
+    def option_values(self):
+        """
+        the current option values, used to see if the options were changed
+        """
+        return (
+            self.__url_bas,
+            self.__show_anchor,
+            self.__search_lang,
+            self.__fg_sel,
+            self.__bg_sel,
+            self.__lang1,
+            self.__lang2,
+        )
 
     def on_load(self):
         """
@@ -249,98 +414,127 @@ class LocalTerm(Gramplet):
         self.__show_anchor = config.get("myopt.show_anchor")
         self.__search_lang = config.get("myopt.search_lang")
         self.__url_bas = config.get("myopt.url_bas")
-        self.__fg_sel = config.get("myopt.fg_sel_col")
-        self.__bg_sel = config.get("myopt.bg_sel_col")
+        self.__fg_sel = sys.intern(config.get("myopt.fg_sel_col"))
+        self.__bg_sel = sys.intern(config.get("myopt.bg_sel_col"))
         self.__lang1 = config.get("myopt.lang1")
         self.__lang2 = config.get("myopt.lang2")
         local_log.info("lang1 i load = %s", self.__lang1)
+        self.set_fl_ar()
 
-    def dequote(self, s):
-        """
-        If a string has single or double quotes around it, remove them.
-        Make sure the pair of quotes match.
-        If a matching pair of quotes is not found,
-        or there are less than 2 characters, return the string unchanged.
-        """
-        s = s.strip()
-        if (len(s) >= 2 and s[0] == s[-1]) and s.startswith(("'", '"')):
-            return s[1:-1]
-        return s
-
-    def clean_translatable(self, s):
+    def parse_file(self, flnm, stamp=None):
         """
-        if s starts with '_(' and ends with ')' remove these
+        parse a localterm file into a list of (term, translatable, anchor)
+        translatables and anchors are interned as the language files share
+        most of them
+        the result is cached until the modification time or size of the file changes
+        stamp is the (modification time, size) of the file if the caller has it
         """
-        s = self.dequote(s)
-        if s.startswith("_(") and s.endswith(")"):
-            return s[2:-1].strip()
-        return s
-
-    def load_file(self, flnm):
+        if stamp is None:
+            stat = os.stat(flnm)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.__parse_cache.get(flnm)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        local_log.info("--> parse file %s", flnm)
+        dequote = _dequote
+        clean_translatable = _clean_translatable
+        intern = sys.intern
+        with open(flnm, encoding="utf-8", newline="") as myfile:
+            lines = myfile.read().splitlines()
+        # a file where none of the first records has three sections is skipped
+        # with one message instead of one message per line
+        probe = list(
+            itertools.islice(
+                filter(None, csv.reader(lines[1:], _LocalTermDialect)), _PROBE_LINES
+            )
+        )
+        if probe and all(len(words) != 3 for words in probe):
+            self.__errors.append(flnm + _T_NOT_LOCALTERM)
+            self.__parse_cache[flnm] = (stamp, [])
+            return []
+        # the header is skipped, every record is one line of the file
+        reader = csv.reader(lines[1:], _LocalTermDialect)
+        parsed = list(reader)
+        if reader.line_num != len(parsed):
+            # a missing closing quote made a record run on into the next
+            # lines, the file is parsed again one line at a time so only the
+            # line with the missing quote is reported and the rest is kept
+            parsed = [
+                next(csv.reader((line,), _LocalTermDialect), [])
+                for line in lines[1:]
+            ]
+        # record i is line i + 2 of the file, the report shows the raw line
+        records = []
+        for linenbr, words in enumerate(parsed, 2):
+            if len(words) == 3:
+                records.append(words)
+                continue
+            line = lines[linenbr - 1].rstrip()
+            if len(line) >= 10:
+                self.__errors.append(
+                    str(linenbr) + _T_BAD_LINE + line + 'i" File: ' + flnm
+                )
+        rows = [
+            (dequote(term), clean_translatable(translatable), intern(anchor.strip()))
+            for term, translatable, anchor in records
+        ]
+        self.__parse_cache[flnm] = (stamp, rows)
+        return rows
+
+    def load_file(self, flnm, stamp=None):
         """
-        loading the file into the treeview
+        loading the file into the entries dictionary
         """
         local_log.info("--> load file %s", flnm)
         self.sort_date = ""
+        # entries: translatable -> [language 1, anchor 1, language 2, anchor 2]
+        # a term only found in language 2 is created with its anchor as anchor 1
         if self.filenbr == 0:
-            self.lang1_txt.clear()
-            self.lang1_loc.clear()
-            self.lang2_txt.clear()
-            self.lang2_loc.clear()
-        self.linenbr = 0
-        with open(flnm, encoding="utf-8") as myfile:
-            for line in myfile:
-                self.linenbr += 1
-                if self.linenbr > 1:
-                    line = line.rstrip() + ","
-                    words = line.split(",")
-                    if len(words) != 4:
-                        if len(line) > 10:
-                            errormessage = (
-                                _(
-                                    ': line does not contain three sections separated by , in : "'
-                                )
-                                + line
-                                + 'i" File: '
-                                + flnm
-                            )
-                            errormessage = str(self.linenbr) + errormessage
-                            ErrorDialog(_("Error:"), errormessage)
-                    else:
-                        words[0] = self.dequote(words[0])
-                        words[1] = self.clean_translatable(words[1])
-                        words[1] = self.dequote(words[1])
-
-                        if self.filenbr == 0:
-                            self.lang1_txt[words[1]] = words[0]
-                            self.lang1_loc[words[1]] = words[2]
-                            self.lang2_txt[words[1]] = ""
-                        else:
-                            self.lang2_txt[words[1]] = words[0]
-                            self.lang2_loc[words[1]] = words[2]
-
-        if (len(self.__fl_ar) == 1) or (self.filenbr == 1):
-            for key1, value1 in self.lang2_loc.items():
-                if not key1 in self.lang1_txt:
-                    self.lang1_loc[key1] = value1
-                    self.lang1_txt[key1] = ""
-
-            for key, value in self.lang1_txt.items():
-                mytupple = (
-                    key,
-                    value,
-                    self.lang1_loc.get(key, "not found"),
-                    self.lang2_txt.get(key, "not found"),
-                    self.__fg_sel,
-                    self.__bg_sel,
-                )
-                self.model.append(mytupple)
+            txt_idx, loc_idx = 0, 1
+        else:
+            txt_idx, loc_idx = 2, 3
+        setdefault = self.entries.setdefault
+        for term, translatable, anchor in self.parse_file(flnm, stamp):
+            row = setdefault(translatable, ["", anchor, "", ""])
+            row[txt_idx] = term
+            row[loc_idx] = anchor
+
+    def try_load(self, flnm, stamp=None):
+        """
+        load a file, a missing file or a directory is reported instead of loaded
+        """
+        try:
+            self.load_file(flnm, stamp)
+        except FileNotFoundError:
+            self.set_text("No path " + flnm)
+            return False
+        except (IsADirectoryError, PermissionError):
+            self.set_text("No file " + flnm)
+            return False
+        return True
+
+    def fill_model(self):
+        """
+        fill the treeview model from the entries dictionary
+        """
+        columns = self._COLS
+        append = self.model.insert_with_valuesv
+        for key, row in self.entries.items():
+            append(-1, columns, (key, row[0], row[1], row[2]))
+
+    def set_colors(self):
+        """
+        set the selected colors on the cell renderer shared by all columns
+        """
+        self.__renderer.set_property("foreground", self.__fg_sel)
+        self.__renderer.set_property("background", self.__bg_sel)
+        self.gui.WIDGET.queue_draw()
 
     def main(self):
-        self.model.clear()
-        col = self.gui.WIDGET.get_column(2)
+        self.set_colors()
+        col = self.__columns[2]
         col.set_visible(self.__show_anchor)
-        col = self.gui.WIDGET.get_column(3)
+        col = self.__columns[3]
         if self.__lang1 == self.__lang2:
             col.set_visible(False)
         else:
@@ -348,28 +542,49 @@ class LocalTerm(Gramplet):
 
 #        col.set_visible(self.__lang1 == self.__lang2)
         local_log.info("Languages = %s  %s", self.__lang1, self.__lang2)
-        if self.__search_lang == 2:
-            self.gui.WIDGET.set_search_column(3)
-        else:
-            self.gui.WIDGET.set_search_column(1)
         local_log.info("--> Main kaldet")
         local_log.info("files to load = %s", self.__fl_ar)  
+        paths = dict(zip(self.file_names(), self.__files))
+        flnms = []
+        for flnm in self.__fl_ar:
+            flnm = paths.get(flnm)
+            if flnm is None:
+                flnm = os.path.join(_DATA_DIR, "default" + "_data_v1_0.txt")
+            flnms.append(flnm)
+        stamps = tuple((flnm, _file_stamp(flnm)) for flnm in flnms)
+        if stamps == self.__last_stamps:
+            local_log.info("files unchanged, model kept")
+            self.set_search_column()
+            return
         self.filenbr = 0
 #        self.__files = []
-        for flnm in self.__fl_ar:
-            flnm = os.path.join(os.path.dirname(__file__), flnm)
-            if not os.path.exists(flnm):
-                flnm = os.path.join(
-                    os.path.dirname(__file__), "default" + "_data_v1_0.txt"
-                )
-            if os.path.exists(flnm):
-                if os.path.isfile(flnm):
-                    self.load_file(flnm)
-                    self.filenbr = self.filenbr + 1
-                else:
-                    self.set_text("No file " + flnm)
-            else:
-                self.set_text("No path " + flnm)
+        # the rows go into a new unsorted model that is not shown yet, it is
+        # sorted once and replaces the old model in the treeview
+        sort_id, sort_order = self.model.get_sort_column_id()
+        self.model = self.new_model()
+        self.entries.clear()
+        self.__errors = []
+        for flnm, stamp in stamps:
+            if self.try_load(flnm, stamp):
+                self.filenbr = self.filenbr + 1
+        if self.__errors:
+            ErrorDialog(_T_ERROR, "\n".join(self.__errors[:50]))
+        self.fill_model()
+        if sort_id is not None:
+            self.model.set_sort_column_id(sort_id, sort_order)
+        self.gui.WIDGET.set_model(self.model)
+        # set_model resets the search column, so it is set after the swap
+        self.set_search_column()
+        self.__last_stamps = stamps
+
+    def set_search_column(self):
+        """
+        search in the language selected in the setup
+        """
+        if self.__search_lang == 2:
+            self.gui.WIDGET.set_search_column(3)
+        else:
+            self.gui.WIDGET.set_search_column(1)
 
     def act(self, _tree_view, path, _column):
         """
@@ -377,15 +592,19 @@ class LocalTerm(Gramplet):
         """
         local_log.info("--> act called")
         tree_iter = self.model.get_iter(path)
-        url = self.model.get_value(tree_iter, 2).strip()
-        if not url.startswith("https://"):
-            url = self.__url_bas + "#" + url
+        url = _compose_url(self.model.get_value(tree_iter, 2), self.__url_bas)
         local_log.info("URL after processing: %s", url)
         if url.startswith("https://"):
             display_url(url)
         else:
-            errormessage = _("Cannot open URL: ") + url
-            ErrorDialog(_("Error:"), errormessage)
+            errormessage = _T_BAD_URL + url
+            ErrorDialog(_T_ERROR, errormessage)
+
+    def new_model(self):
+        """
+        an empty model for the treeview
+        """
+        return Gtk.ListStore(str, str, str, str)
 
     def build_gui(self):
         """
@@ -397,55 +616,35 @@ class LocalTerm(Gramplet):
         self.__lang1 = config.get("myopt.lang1")
         self.__lang2 = config.get("myopt.lang2")
         local_log.info(self.__show_anchor)
-        tip = _("Double click row to follow link")
+        tip = _T_TIP
         self.set_tooltip(tip)
-        self.model = Gtk.ListStore(str, str, str, str, str, str)
+        self.model = self.new_model()
         top = Gtk.TreeView()
         top.connect("row-activated", self.act)
         renderer = Gtk.CellRendererText()
-
-        column = Gtk.TreeViewColumn(
-            _("Translatable"), renderer, text=0, foreground=4, background=5
-        )
-        column.set_sort_column_id(0)
-        column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
-        top.append_column(column)
-
-        column = Gtk.TreeViewColumn(
-            _("Language 1"), renderer, text=1, foreground=4, background=5
-        )
-        column.set_sort_column_id(1)
-        column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
-
-        top.append_column(column)
-        column = Gtk.TreeViewColumn(
-            _("Anchor"), renderer, text=2, foreground=4, background=5
-        )
-        column.set_sort_column_id(2)
-        column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
-        if self.__show_anchor:
-            column.set_visible(True)
-        else:
-            column.set_visible(False)
-
-        top.append_column(column)
-
-        column = Gtk.TreeViewColumn(
-            _("Language 2"), renderer, text=3, foreground=4, background=5
-        )
-        column.set_sort_column_id(3)
-        column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
-        if self.__lang1 == self.__lang2:
-            column.set_visible(False)
-        else:
-            column.set_visible(True)
-
-#        column.set_visible((self.__lang1 == self.__lang2))
+        self.__renderer = renderer
+
+        col_defs = [
+            (_T_TRANSLATABLE, 0, True),
+            (_T_LANG1, 1, True),
+            (_T_ANCHOR, 2, self.__show_anchor),
+            (_T_LANG2, 3, self.__lang1 != self.__lang2),
+        ]
+        for title, idx, visible in col_defs:
+            column = Gtk.TreeViewColumn(title, renderer, text=idx)
+            column.set_sort_column_id(idx)
+            # fixed sizing lets the treeview use fixed height mode, so only
+            # the visible rows are measured instead of every row
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            column.set_fixed_width(_COLUMN_WIDTH)
+            column.set_resizable(True)
+            column.set_visible(visible)
+            top.append_column(column)
+        self.__columns = top.get_columns()
         local_log.info("Languages = %s  %s", self.__lang1, self.__lang2)
 
-        top.append_column(column)
-
         self.model.set_sort_column_id(0, Gtk.SortType.ASCENDING)
+        top.set_fixed_height_mode(True)
         top.set_model(self.model)
         if self.__search_lang == 2:
             top.set_search_column(3)